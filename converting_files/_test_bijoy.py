@@ -1,3 +1,5 @@
+import re
+
 import pandas as pd
 
 df = pd.read_csv('Data_Format_unicode.csv', dtype=str)
@@ -23,10 +25,10 @@ for c in list(df.columns)[:15]:
 
 print()
 print('=== Spot-check columns ===')
-for col in df.columns:
-    if any(w in col for w in watch):
-        sample = df[col].dropna().iloc[:3].tolist() if col in df else []
-        print(f'  {col!r}: {sample}')
+watch_pat = '|'.join(map(re.escape, watch))
+for col in df.columns[df.columns.str.contains(watch_pat)]:
+    sample = df[col].dropna().iloc[:3].tolist()
+    print(f'  {col!r}: {sample}')
 
 print()
 print('=== Row 2 sample fields ===')
@@ -0,0 +1,61 @@
+import os
+import tempfile
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+from main import _apply_to_df, write_csv, write_csv_from_workbook, write_csv_from_xlsx
+
+# Sheet layouts where the streamed CSV must still match the pandas path
+layouts = {
+    'blank first row': [
+        [],
+        ['নাম', 'Amt', 'Note'],
+        ['evsjv‡`k', 3.5, '  '],
+        [],
+        ['x', None, None, None, None, 'far'],
+    ],
+    'data starts at B2': [
+        [],
+        [None, 'Name', 'Amt'],
+        [None, 'Avgvi', 1],
+    ],
+    'row wider than header': [
+        ['Name', 'Amt'],
+        ['Avgvi', 1, 'extra', 2.5],
+    ],
+    'duplicate headers': [
+        ['a', 'a', 'a.1', None, 'a'],
+        [1, 2, 3, 4, 5],
+    ],
+}
+
+
+def read(path: str) -> str:
+    with open(path, encoding='utf-8-sig') as f:
+        return f.read()
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    for name, rows in layouts.items():
+        xlsx = os.path.join(tmp, 'in.xlsx')
+        wb = Workbook()
+        for row in rows:
+            wb.active.append(row)
+        wb.save(xlsx)
+
+        expected_csv = os.path.join(tmp, 'pandas.csv')
+        df = pd.read_excel(xlsx, dtype=str, keep_default_na=False)
+        write_csv(_apply_to_df(df), expected_csv)
+        expected = read(expected_csv)
+
+        streamed_csv = os.path.join(tmp, 'streamed.csv')
+        write_csv_from_xlsx(xlsx, streamed_csv)
+        workbook_csv = os.path.join(tmp, 'workbook.csv')
+        write_csv_from_workbook(load_workbook(xlsx), workbook_csv)
+
+        assert read(streamed_csv) == expected, (name, read(streamed_csv), expected)
+        assert read(workbook_csv) == expected, (name, read(workbook_csv), expected)
+        print(f'  ok: {name}')
+
+print('All layouts match the pandas output')
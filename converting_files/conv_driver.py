@@ -1,9 +1,20 @@
 import argparse
+import functools
 import os
+import re
 from typing import Any
 
 import pandas as pd
-import unicodeconverter as uc
+
+from fast_converter import fast_convert_bijoy_to_unicode
+
+
+# Any character from the Bengali Unicode block (U+0980–U+09FF)
+_RE_BENGALI = re.compile("[\u0980-\u09FF]")
+
+# Any letter in the str.isalpha() sense: \w minus digits and underscore, and
+# minus the Latin-1 numerics (² ³ ¹ ¼ ½ ¾) that \w also admits
+_RE_LETTER = re.compile("[^\\W\\d_\u00B2\u00B3\u00B9\u00BC-\u00BE]")
 
 
 def _looks_like_bijoy(text: str) -> bool:
@@ -17,39 +28,57 @@ def _looks_like_bijoy(text: str) -> bool:
 	if not text or text.isspace():
 		return False
 
-	has_alpha = False
-	for ch in text:
-		code = ord(ch)
-		# If we see any Bengali-range character, treat as already-Unicode Bangla
-		if 0x0980 <= code <= 0x09FF:
-			return False
-		if ch.isalpha():
-			has_alpha = True
+	# If we see any Bengali-range character, treat as already-Unicode Bangla
+	if _RE_BENGALI.search(text):
+		return False
 
 	# No Bengali letters, but has some alphabetic characters -> probably Bijoy
-	return has_alpha
+	return _RE_LETTER.search(text) is not None
 
 
 def convert_bijoy_in_value(value: Any) -> Any:
 	"""Convert a value from Bijoy to Unicode only when it looks like Bijoy text."""
 
-	if isinstance(value, str) and value.strip() and _looks_like_bijoy(value):
-		try:
-			return uc.convert_bijoy_to_unicode(value)
-		except Exception:
-			# If anything goes wrong, fall back to original value
-			return value
+	# _looks_like_bijoy already rejects empty/whitespace-only strings
+	if isinstance(value, str) and _looks_like_bijoy(value):
+		return _convert_bijoy_text(value)
 	return value
 
 
+@functools.lru_cache(maxsize=None)
+def _convert_bijoy_text(value: str) -> str:
+	"""Memoized converter: each distinct string goes through unicodeconverter once."""
+
+	try:
+		return fast_convert_bijoy_to_unicode(value)
+	except Exception:
+		# If anything goes wrong, fall back to original value
+		return value
+
+
+def _convert_series(series: pd.Series) -> pd.Series:
+	"""Convert a column by mapping its unique strings instead of calling per cell."""
+
+	if series.dtype != object:
+		return series
+	mapping = {
+		value: convert_bijoy_in_value(value)
+		for value in series.dropna().unique()
+		if isinstance(value, str)
+	}
+	mapped = series.map(mapping)
+	# Numbers, dates etc. are not in the mapping -> keep the original cell
+	return mapped.where(mapped.notna(), series)
+
+
 def convert_excel_bijoy_to_unicode(input_path: str, output_csv_path: str) -> None:
 	"""Read an Excel file, convert Bijoy-encoded Bangla text to Unicode, and save as CSV."""
 
 	# Read all sheets and concatenate, or just the first? For generality, use first sheet.
 	df = pd.read_excel(input_path)
 
-	# Apply conversion to every cell
-	df_converted = df.applymap(convert_bijoy_in_value)
+	# Apply conversion to every cell, one column at a time
+	df_converted = df.apply(_convert_series)
 
 	# Also convert column headers and index labels, which pandas keeps separate
 	df_converted.columns = [convert_bijoy_in_value(col) for col in df_converted.columns]
@@ -0,0 +1,135 @@
+"""
+Drop-in fast path for unicodeconverter.convert_bijoy_to_unicode
+================================================================
+The library converts in five steps: punctuation/whitespace regexes, a
+multi-character pre-map, segmentation, segment rearrangement, and the final
+Bijoy → Unicode mapping.  Segmentation and the final mapping each loop over
+~230 map entries calling str.replace once per entry — hundreds of string
+copies per cell.
+
+Almost every key of bijoy_to_unicode is a single character, so both loops
+collapse into one str.translate each (a single C pass over the string).
+The few multi-character keys are still applied with str.replace, before the
+table, exactly as the library's dict order does.  Rearrangement (reph,
+pre-kar reordering, …) is delegated to the library unchanged, so output is
+identical.
+
+All tables are derived once at import — the library keeps its maps as
+plain module-level dicts (there is no converter object to warm up), so
+nothing is rebuilt per call.  The punctuation, whitespace and newline steps
+are copies of the library's, so at import the fast path is also compared
+with uc.convert_bijoy_to_unicode on a few fixed strings.  If the library's
+internal modules are missing, the map table breaks the assumptions below,
+or that comparison fails, fast_convert_bijoy_to_unicode just calls the
+library.
+"""
+
+import re
+from typing import Dict, List, Tuple
+
+import unicodeconverter as uc
+
+try:
+    from unicodeconverter.maps import bijoy_pre_map, bijoy_to_unicode
+    from unicodeconverter.utils.rearrange import rearrange_bijoy_text
+except ImportError:
+    # Internal layout changed — only the public entry point is safe to use
+    bijoy_pre_map = bijoy_to_unicode = rearrange_bijoy_text = None
+
+_RE_PUNCT  = re.compile('([.,!?();:-])')
+_RE_SPACES = re.compile('[\r\t\f\v  ]{2,}')
+
+_PRE_MAP = list(bijoy_pre_map.items()) if bijoy_pre_map is not None else []
+
+# Fixed samples for the import-time comparison with the library: punctuation,
+# runs of whitespace, newlines, pre-map pairs, reph and pre-kar reordering
+_SELF_CHECK = (
+    "Avgvi †mvbvi evsjv, Avwg †Zvgvq fvjevwm|",
+    "ÔcÖ_g Aa¨vqÕ (1-2): K¬vm  k¨vgj\nM¥ ¯Œ wK?",
+    "Kg©KZ©v; c~e© †Kv¤úvwb. e¨e¯’vcbv!",
+)
+
+
+def _build_tables():
+    """Split bijoy_to_unicode into multi-char keys (replace) and a translate table.
+
+    Returns None when the library's maps could not be imported, or when
+    sequential str.replace and str.translate could disagree: a multi-char
+    key processed after one of its own characters, a mapped value that
+    contains a key, or a tab (segment separator) used as a key.
+    """
+    if bijoy_to_unicode is None or rearrange_bijoy_text is None:
+        return None
+    keys = list(bijoy_to_unicode)
+    position = {k: i for i, k in enumerate(keys)}
+    multi = [k for k in keys if len(k) > 1]
+    single = [k for k in keys if len(k) == 1]
+
+    if "\t" in position:
+        return None
+    for k in multi:
+        if any(position.get(ch, len(keys)) < position[k] for ch in k):
+            return None
+    for k, v in bijoy_to_unicode.items():
+        if any(key in v and key != v for key in keys):
+            return None
+
+    # (key, segmented key, Unicode) — built once so calls do no concatenation
+    multi_pairs: List[Tuple[str, str, str]] = [
+        (k, "\t" + k, bijoy_to_unicode[k]) for k in multi
+    ]
+    segment: Dict[int, str] = {ord(k): "\t" + k for k in single}
+    final: Dict[int, str] = {ord(k): bijoy_to_unicode[k] for k in single}
+    return multi_pairs, segment, final
+
+
+def _table_convert(text: str, tables) -> str:
+    """The library's pipeline, with both map loops done through tables."""
+    multi, segment, final = tables
+
+    # Handle punctuations
+    text = _RE_PUNCT.sub(r'\t\1', text)
+    text = _RE_SPACES.sub(' ', text)
+
+    # Handle new lines
+    text = text.replace('\n', '\t\n')
+
+    # Handle multiple char tokens
+    for pre_pattern, post_pattern in _PRE_MAP:
+        if pre_pattern in text:
+            text = text.replace(pre_pattern, post_pattern)
+
+    # Segmentation
+    for key, segmented, _ in multi:
+        text = text.replace(key, segmented)
+    text = text.translate(segment)
+
+    text = rearrange_bijoy_text(text.strip())
+
+    # Convert to Unicode
+    for key, _, unicode_text in multi:
+        text = text.replace(key, unicode_text)
+    return text.translate(final).strip()
+
+
+def _build_checked_tables():
+    """_build_tables(), or None unless the result reproduces the library on _SELF_CHECK."""
+    tables = _build_tables()
+    if tables is None:
+        return None
+    try:
+        if all(_table_convert(t, tables) == uc.convert_bijoy_to_unicode(t) for t in _SELF_CHECK):
+            return tables
+    except Exception:
+        pass  # a changed pipeline step may fail outright rather than differ
+    return None
+
+
+_TABLES = _build_checked_tables()
+
+
+def fast_convert_bijoy_to_unicode(text: str) -> str:
+    """Convert Bijoy text to Unicode; same result as uc.convert_bijoy_to_unicode."""
+    if _TABLES is None:
+        return uc.convert_bijoy_to_unicode(text)
+    return _table_convert(text, _TABLES)
@@ -29,17 +29,31 @@ passed through as-is (they are already correct Unicode Bangla).
 """
 
 import argparse
+import csv
 import os
-from typing import Any
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
-import unicodeconverter as uc
+
+from fast_converter import fast_convert_bijoy_to_unicode
 
 try:
     from openpyxl import load_workbook
 except Exception:
     load_workbook = None
 
+# Arrow-backed strings keep cell text in contiguous buffers and give the
+# vectorized .str scans below a native fast path; plain str otherwise.
+try:
+    import pyarrow  # noqa: F401
+    _STR_DTYPE: Any = "string[pyarrow]"
+except Exception:
+    _STR_DTYPE = str
+
 
 # ── Bengali Unicode ranges ─────────────────────────────────────────────────
 _BN_START = 0x0980
@@ -56,31 +70,46 @@ _VOWEL_SIGN_RANGE = (0x09BE, 0x09CC)
 # sequences like ৎৎ or ৎধ which are impossible in real Bengali.
 _KHANDA_TA = '\u09CE'
 
+# Fewest strings worth handing to one worker: ~30 ms of fast-path
+# conversion, several times what forking a worker and shipping its batch
+# costs. A batch therefore needs twice this before the pool is used at all.
+_PARALLEL_MIN_CHUNK = 2500
 
-def _has_bengali(text: str) -> bool:
-    """True if text already contains Bengali Unicode characters."""
-    return any(_BN_START <= ord(c) <= _BN_END for c in text)
+# Rows converted together when streaming an .xlsx straight to CSV
+_STREAM_BLOCK_ROWS = 5000
 
+# Raw conversion results shared by cells, headers, index labels and sheet
+# titles — and by every workbook processed in the same run. Filled both by
+# the per-value path and by _build_mapping (including process-pool results).
+_CONV_CACHE: Dict[str, Optional[str]] = {}
 
-def _has_vowel_sign(text: str) -> bool:
-    """True if text contains at least one Bengali dependent vowel sign (Mc)."""
-    return any(_VOWEL_SIGN_RANGE[0] <= ord(c) <= _VOWEL_SIGN_RANGE[1] for c in text)
 
+# Precompiled scanners — the regex engine walks the string in C instead of
+# a per-codepoint Python generator.
+_BN_CLASS          = f"[{chr(_BN_START)}-{chr(_BN_END)}]"
+_VOWEL_SIGN_CLASS  = f"[{chr(_VOWEL_SIGN_RANGE[0])}-{chr(_VOWEL_SIGN_RANGE[1])}]"
+_RE_BENGALI        = re.compile(_BN_CLASS)
+# One anchored match: the negative lookahead rejects ৎ before another Bengali
+# codepoint anywhere in the text, then the lazy scan stops at the first vowel sign.
+_RE_VALID_BANGLA   = re.compile(f"(?s)(?!.*{_KHANDA_TA}{_BN_CLASS}).*?{_VOWEL_SIGN_CLASS}")
 
-def _has_invalid_khanda_ta(text: str) -> bool:
-    """True if ৎ is immediately followed by another Bengali codepoint.
 
-    In valid Bengali, ৎ (Khanda Ta) only ever appears at the end of a word —
-    never before another Bengali letter, sign, or digit. Its presence before
-    another Bengali codepoint is a reliable indicator that the text is garbled
-    output produced by running English through the Bijoy converter (the letter
-    'r' in Bijoy maps to ৎ).
+def _has_bengali(text: str) -> bool:
+    """True if text already contains Bengali Unicode characters."""
+    return _RE_BENGALI.search(text) is not None
+
+
+def _is_valid_bangla(text: str) -> bool:
+    """True if converted text looks like real Bangla rather than garbled English.
+
+    Two conditions, checked in a single regex pass:
+    1. At least one Bengali dependent vowel sign (Mc) is present.
+    2. ৎ (Khanda Ta) is never immediately followed by another Bengali
+       codepoint. In valid Bengali, ৎ only ever appears at the end of a
+       word; before another letter, sign, or digit it is a reliable sign of
+       English run through the Bijoy converter (the letter 'r' maps to ৎ).
     """
-    for i, ch in enumerate(text):
-        if ch == _KHANDA_TA and i + 1 < len(text):
-            if _BN_START <= ord(text[i + 1]) <= _BN_END:
-                return True
-    return False
+    return _RE_VALID_BANGLA.match(text) is not None
 
 
 def convert_bijoy_in_value(value: Any) -> Any:
@@ -93,45 +122,389 @@ def convert_bijoy_in_value(value: Any) -> Any:
     4. Keep the converted result ONLY if it contains a Bengali vowel sign —
        this reliably separates valid Bangla from garbled English.
     5. Otherwise return the original value unchanged.
+
+    The unicodeconverter call is memoized per distinct string in _CONV_CACHE,
+    so repeated names, branches, districts, etc. are converted only once.
     """
-    if not isinstance(value, str):
-        return value
-    if not value.strip():
+    # isspace() scans in place; strip() would allocate a copy per cell
+    if not isinstance(value, str) or not value or value.isspace():
         return value
 
     # Already proper Unicode Bangla — leave alone
     if _has_bengali(value):
         return value
 
-    try:
-        converted = uc.convert_bijoy_to_unicode(value)
-    except Exception:
-        return value
+    converted = _bijoy_to_unicode(value)
 
     # Accept only if conversion produced valid Bangla:
     #   1. Has at least one Bengali dependent vowel sign (rules out pure-consonant garble).
     #   2. ৎ does NOT appear before another Bengali codepoint (rules out English
     #      words containing 'r', which Bijoy maps to ৎ, e.g. "Super-Newmerray").
-    if _has_vowel_sign(converted) and not _has_invalid_khanda_ta(converted):
+    if converted is not None and _is_valid_bangla(converted):
         return converted
 
     # Otherwise: garbled output from English or non-Bijoy text — discard.
     return value
 
 
-# ── Output helpers ─────────────────────────────────────────────────────────
+def _raw_convert(value: str) -> Optional[str]:
+    """Raw Bijoy → Unicode conversion; None if the converter raises."""
+    try:
+        return fast_convert_bijoy_to_unicode(value)
+    except Exception:
+        return None
+
+
+def _bijoy_to_unicode(value: str) -> Optional[str]:
+    """Memoized _raw_convert backed by the process-wide _CONV_CACHE."""
+    try:
+        return _CONV_CACHE[value]
+    except KeyError:
+        converted = _CONV_CACHE[value] = _raw_convert(value)
+        return converted
+
+
+# ── DataFrame conversion ───────────────────────────────────────────────────
+
+def _is_text_column(s: pd.Series) -> bool:
+    """True for columns that can hold strings (object or pandas string dtype)."""
+    return s.dtype == object or isinstance(s.dtype, pd.StringDtype)
 
-def _apply_to_df(df: pd.DataFrame) -> pd.DataFrame:
-    """Apply Bijoy conversion to all cells, column headers, and index."""
-    df_out = df.map(convert_bijoy_in_value)
+
+def _pending_strings(s: pd.Series) -> List[str]:
+    """Unique strings in a column that still need a conversion attempt.
+
+    Blank uniques and uniques that already contain Bengali Unicode are masked
+    out with vectorized str methods, so they never reach the Python converter.
+    """
+    if not _is_text_column(s):
+        return []
+    if s.dtype == object:
+        uniques = pd.Series(
+            [u for u in s.dropna().unique() if isinstance(u, str)], dtype=object
+        )
+    else:
+        uniques = pd.Series(s.dropna().unique(), dtype=s.dtype)
+    # Pattern strings (not compiled objects) so Arrow-backed columns can use
+    # their native regex kernel
+    skip = (
+        uniques.str.contains(_RE_BENGALI.pattern)
+        | ~uniques.str.contains(r"\S")
+    )
+    return uniques[~skip].tolist()
+
+
+def _convert_chunk(values: List[str]) -> Dict[str, Optional[str]]:
+    """Worker entry point: run the raw converter over a batch of strings."""
+    return {v: _raw_convert(v) for v in values}
+
+
+class ConversionPool:
+    """Worker processes shared by every _build_mapping call of one run.
+
+    Nothing is forked until a batch can give two workers _PARALLEL_MIN_CHUNK
+    strings each, and a batch never gets more workers than that allows (nor
+    more than jobs). Use as a context manager so the workers are shut down.
+    """
+
+    def __init__(self, jobs: Optional[int] = None) -> None:
+        self.jobs = jobs or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._workers = 0
+
+    def __enter__(self) -> "ConversionPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._workers = 0
+
+    def convert(self, values: List[str]) -> Dict[str, Optional[str]]:
+        """Raw-convert values, across workers when the batch is big enough."""
+        workers = min(self.jobs, len(values) // _PARALLEL_MIN_CHUNK)
+        if workers < 2:
+            return _convert_chunk(values)
+        if workers > self._workers:
+            # Larger than any batch so far: restart with more workers
+            self.close()
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+            self._workers = workers
+        result: Dict[str, Optional[str]] = {}
+        for part in self._executor.map(_convert_chunk, [values[i::workers] for i in range(workers)]):
+            result.update(part)
+        return result
+
+
+def _build_mapping(values: List[str], pool: Optional[ConversionPool] = None) -> Dict[str, str]:
+    """Convert pending strings and return only the accepted original → Unicode pairs.
+
+    Conversion runs once per string, spread across pool's processes for
+    large batches (unicodeconverter is pure Python, so threads would
+    serialise on the GIL); without a pool it runs serially. Validation then
+    runs over the whole batch as one vectorized str.match against
+    _RE_VALID_BANGLA.
+    """
+    missing = [v for v in values if v not in _CONV_CACHE]
+    _CONV_CACHE.update(pool.convert(missing) if pool is not None else _convert_chunk(missing))
+
+    converted = pd.Series({v: _CONV_CACHE[v] for v in values}, dtype=object)
+    keep = converted.str.match(_RE_VALID_BANGLA, na=False)
+    return converted[keep].to_dict()
+
+
+def _convert_series(s: pd.Series, mapping: Dict[str, str]) -> pd.Series:
+    """Convert one column with a dict lookup per cell."""
+    if not _is_text_column(s) or not mapping:
+        return s
+    mapped = s.map(mapping)
+    # Cells absent from the mapping (Bengali, blank, rejected, non-string)
+    # keep the original value; s.where preserves the column's dtype
+    return s.where(mapped.isna(), mapped)
+
+
+def _apply_to_df(df: pd.DataFrame, pool: Optional[ConversionPool] = None) -> pd.DataFrame:
+    """Apply Bijoy conversion to all cells, column headers, and index.
+
+    Unique strings are collected across the whole sheet first, so each is
+    converted exactly once no matter how many columns it appears in.
+    """
+    pending = set()
+    for _, col in df.items():
+        pending.update(_pending_strings(col))
+    mapping = _build_mapping(sorted(pending), pool)
+
+    df_out = df.apply(_convert_series, args=(mapping,))
     df_out.columns = [convert_bijoy_in_value(c) for c in df_out.columns]
     df_out.index   = [convert_bijoy_in_value(i) for i in df_out.index]
     return df_out
 
 
-def write_csv(df: pd.DataFrame, path: str) -> None:
+# ── Output helpers ─────────────────────────────────────────────────────────
+
+def _write_csv_rows(path: str, header: Iterable[Any], rows: Iterable[Iterable[Any]]) -> None:
+    """Write header + rows as UTF-8 (BOM) CSV, consuming rows lazily.
+
+    Line endings follow os.linesep, matching pandas' DataFrame.to_csv.
+    """
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    df.to_csv(path, index=False, encoding="utf-8-sig")
+    with open(path, "w", encoding="utf-8-sig", newline="") as fh:
+        writer = csv.writer(fh, lineterminator=os.linesep)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def write_csv(df: pd.DataFrame, path: str) -> None:
+    """Write a DataFrame row by row with csv.writer (no to_csv string buffer)."""
+    if df.isna().values.any():
+        df = df.fillna("")  # to_csv writes NaN as an empty field
+    _write_csv_rows(path, df.columns, df.itertuples(index=False, name=None))
+
+
+class _FormulaCellError(Exception):
+    """A formula cell was met in a workbook loaded without cached values."""
+
+
+def _csv_cell(cell: Any) -> Any:
+    """Normalise an openpyxl cell the way pd.read_excel(dtype=str) would."""
+    if cell.data_type == "f":
+        # Only data_only workbooks carry the cached formula result
+        raise _FormulaCellError(cell.coordinate)
+    value = cell.value
+    if value is None or cell.data_type == "e":
+        return ""  # blanks → "", error cells (#REF!, #N/A, …) → NaN → ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+# One NaN object, so duplicate NaN header names collide as they do in pandas
+_NAN = float("nan")
+
+
+def _is_blank(value: Any) -> bool:
+    """True for cells pandas reads as "" (empty, or an empty string)."""
+    return value is None or value == ""
+
+
+def _trimmed_len(values: Iterable[Any]) -> int:
+    """Length of a row of raw cell values once trailing blanks are dropped."""
+    values = list(values)
+    n = len(values)
+    while n and _is_blank(values[n - 1]):
+        n -= 1
+    return n
+
+
+def _scan_sheet(ws: Any) -> Tuple[int, List[int]]:
+    """Value-only pre-pass: (widest trimmed row, indices of columns holding booleans).
+
+    pandas pads every row to the widest one, so the width must be known
+    before the header is written. On a read_only worksheet this parses the
+    sheet XML a second time: its stored dimensions can't be trusted (pandas
+    resets them too), and the boolean columns need the values anyway.
+    """
+    width = 0
+    bool_cols: Set[int] = set()
+    for values in ws.iter_rows(values_only=True):
+        width = max(width, _trimmed_len(values))
+        if bool in set(map(type, values)):
+            bool_cols.update(j for j, v in enumerate(values) if type(v) is bool)
+    return width, sorted(bool_cols)
+
+
+def _dedupe_header(header: List[Any]) -> List[Any]:
+    """Name blank headers "Unnamed: N" and mangle duplicates like pandas.
+
+    Port of the python parser's loop: named columns are numbered before
+    unnamed ones, and a generated "name.N" that already exists keeps
+    incrementing (a, a, a.1 → a, a.2, a.1).
+    """
+    columns: List[Any] = []
+    unnamed: List[int] = []
+    for i, name in enumerate(header):
+        if name == "":
+            unnamed.append(i)
+            name = f"Unnamed: {i}"
+        columns.append(name)
+
+    counts: Dict[Any, int] = defaultdict(int)
+    unnamed_set = set(unnamed)
+    for i in [i for i in range(len(columns)) if i not in unnamed_set] + unnamed:
+        col = old_col = columns[i]
+        cur_count = counts[col]
+        while cur_count > 0:
+            counts[old_col] = cur_count + 1
+            col = f"{old_col}.{cur_count}"
+            if col in columns:
+                cur_count += 1
+            else:
+                cur_count = counts[col]
+        columns[i] = col
+        counts[col] = cur_count + 1
+    return columns
+
+
+def _iter_sheet_rows(ws: Any) -> Iterator[List[Any]]:
+    """Yield a worksheet's rows normalised for CSV output (header first).
+
+    Mirrors pandas' openpyxl reader: trailing empty cells and trailing empty
+    rows are dropped, every row (header included) is padded to the widest
+    row, blank headers become "Unnamed: N", and duplicate headers are
+    mangled as pandas does. The width takes one value-only pre-pass; after
+    that only one row (plus a run of pending blank rows) is held at a time.
+    """
+    width, bool_cols = _scan_sheet(ws)
+    rows = ws.iter_rows()
+
+    # Error cells in the header are NaN names to pandas ("" in the CSV, and
+    # a second one is mangled to "nan.1"), so they get the shared _NAN
+    header = [
+        _NAN if c.data_type == "e" else _csv_cell(c)
+        for c in next(rows, ())
+    ][:width]
+    header = _dedupe_header(header + [""] * (width - len(header)))
+    # All-numeric names with at least one float (or NaN) make a float Index
+    kinds = {type(name) for name in header}
+    if float in kinds and kinds <= {int, float}:
+        header = [float(name) if type(name) is int else name for name in header]
+    elif datetime in kinds and all(
+        name is _NAN or (type(name) is datetime and name.time() == time())
+        for name in header
+    ):
+        # An all-midnight DatetimeIndex (NaN names are NaT) is written as dates
+        header = [name if name is _NAN else name.date() for name in header]
+    yield header
+
+    first_seen: Dict[Tuple[int, int], Any] = {}
+    blank_run = 0
+    for raw in rows:
+        n = _trimmed_len(c.value for c in raw)
+        if not n:
+            blank_run += 1
+            continue
+        for _ in range(blank_run):
+            yield [""] * width
+        blank_run = 0
+        row = [_csv_cell(c) for c in raw[:n]]
+        # pandas stringifies a column through its unique values, where True
+        # and 1 (False and 0) are one key: the first one seen names both
+        for j in bool_cols:
+            if j < n and row[j] in (0, 1) and type(row[j]) in (bool, int):
+                row[j] = first_seen.setdefault((j, int(row[j])), row[j])
+        yield row + [""] * (width - n)
+
+
+def _iter_xlsx_rows(input_xlsx: str) -> Iterator[List[Any]]:
+    """Yield the first sheet's rows from a read_only, data_only workbook."""
+    wb = load_workbook(input_xlsx, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        ws.reset_dimensions()
+        yield from _iter_sheet_rows(ws)
+    finally:
+        wb.close()
+
+
+def _convert_rows(rows: List[List[Any]], pool: Optional[ConversionPool] = None) -> List[List[Any]]:
+    """Convert a block of rows via one mapping over its unique pending strings."""
+    pending = {
+        v for row in rows for v in row
+        if isinstance(v, str) and v and not v.isspace() and not _has_bengali(v)
+    }
+    mapping = _build_mapping(sorted(pending), pool)
+    # Strings missing from the mapping were rejected → keep the original
+    return [[mapping.get(v, v) if isinstance(v, str) else v for v in row] for row in rows]
+
+
+def _write_converted_csv(
+    rows: Iterator[List[Any]], path: str, pool: Optional[ConversionPool]
+) -> None:
+    """Convert header + rows from _iter_sheet_rows and stream them to CSV.
+
+    Data rows are converted in blocks of _STREAM_BLOCK_ROWS, so peak memory
+    stays near one block regardless of sheet size.
+    """
+    header = next(rows)
+
+    def converted_rows() -> Iterator[List[Any]]:
+        block: List[List[Any]] = []
+        for row in rows:
+            block.append(row)
+            if len(block) >= _STREAM_BLOCK_ROWS:
+                yield from _convert_rows(block, pool)
+                block = []
+        if block:
+            yield from _convert_rows(block, pool)
+
+    header = ["" if h is _NAN else convert_bijoy_in_value(h) for h in header]
+    _write_csv_rows(path, header, converted_rows())
+
+
+def write_csv_from_xlsx(
+    input_xlsx: str, path: str, pool: Optional[ConversionPool] = None
+) -> None:
+    """Stream an .xlsx into a converted UTF-8 CSV without building a DataFrame.
+
+    Rows are read from a read_only, data_only workbook, so formula cells
+    contribute their cached results.
+    """
+    if load_workbook is None:
+        raise RuntimeError("Install openpyxl:  pip install openpyxl")
+    _write_converted_csv(_iter_xlsx_rows(input_xlsx), path, pool)
+
+
+def write_csv_from_workbook(wb: Any, path: str, pool: Optional[ConversionPool] = None) -> None:
+    """Write the converted CSV from an already-loaded (unconverted) workbook.
+
+    Raises _FormulaCellError if the first sheet holds formulas: a workbook
+    loaded with data_only=False has no cached results to export.
+    """
+    _write_converted_csv(_iter_sheet_rows(wb.worksheets[0]), path, pool)
 
 
 def write_excel_from_df(df: pd.DataFrame, path: str) -> None:
@@ -143,23 +516,49 @@ def write_excel_from_df(df: pd.DataFrame, path: str) -> None:
         df.to_excel(writer, index=False, sheet_name="Sheet1")
 
 
-def write_excel_preserve_formatting(input_xlsx: str, output_xlsx: str) -> None:
-    """Load original Excel with openpyxl, convert cell text, save as new file.
+def convert_workbook_inplace(wb: Any, pool: Optional[ConversionPool] = None) -> None:
+    """Convert sheet titles and string cells of a loaded workbook in place.
 
     All cell styles, column widths, merged cells, etc. are preserved because
-    we only replace .value on string cells.
+    we only replace .value on string cells. Unique strings from every sheet
+    are converted together through _build_mapping, so large workbooks use
+    the process pool and text shared between sheets is converted once.
     """
+    # openpyxl already classifies formulas as "f"; numbers, dates and
+    # booleans are never converted either
+    text_cells = [
+        cell
+        for ws in wb.worksheets
+        for row in ws.iter_rows()
+        for cell in row
+        if cell.data_type == "s"
+    ]
+    pending = {
+        cell.value for cell in text_cells
+        if cell.value and not cell.value.isspace() and not _has_bengali(cell.value)
+    }
+    mapping = _build_mapping(sorted(pending), pool)
+
+    for cell in text_cells:
+        converted = mapping.get(cell.value)
+        if converted is not None:
+            cell.value = converted
+            # Text that happens to start with "=" must stay text
+            cell.data_type = "s"
+
+    for ws in wb.worksheets:
+        ws.title = convert_bijoy_in_value(ws.title)
+
+
+def write_excel_preserve_formatting(
+    input_xlsx: str, output_xlsx: str, pool: Optional[ConversionPool] = None
+) -> None:
+    """Load original Excel with openpyxl, convert cell text, save as new file."""
     if load_workbook is None:
         raise RuntimeError("Install openpyxl:  pip install openpyxl")
 
     wb = load_workbook(input_xlsx, data_only=False)
-
-    for ws in wb.worksheets:
-        ws.title = convert_bijoy_in_value(ws.title)
-        for row in ws.iter_rows():
-            for cell in row:
-                if isinstance(cell.value, str) and not cell.value.startswith("="):
-                    cell.value = convert_bijoy_in_value(cell.value)
+    convert_workbook_inplace(wb, pool)
 
     os.makedirs(os.path.dirname(output_xlsx) or ".", exist_ok=True)
     wb.save(output_xlsx)
@@ -180,6 +579,12 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Directory to write outputs (default: same directory as input).",
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for conversion (default: CPU count; 1 disables).",
+    )
     return parser.parse_args()
 
 
@@ -197,35 +602,55 @@ def main() -> None:
     out_csv   = os.path.join(out_dir, f"{base_name}_unicode.csv")
     out_xlsx  = os.path.join(out_dir, f"{base_name}_unicode.xlsx")
 
-    if ext.lower() in (".xlsx", ".xls"):
-        # ── Excel input path ──────────────────────────────────────────────
-        # 1. Write CSV (via pandas — no formatting)
-        df = pd.read_excel(input_path, dtype=str, keep_default_na=False)
-        df_converted = _apply_to_df(df)
-        write_csv(df_converted, out_csv)
-        print(f"✓ CSV written to:   {out_csv}")
-
-        # 2. Write formatting-preserved Excel (via openpyxl direct edit)
-        if load_workbook is not None:
-            write_excel_preserve_formatting(input_path, out_xlsx)
-            print(f"✓ Excel written to: {out_xlsx}")
-        else:
-            # Fallback — no formatting preserved but still useful
-            write_excel_from_df(df_converted, out_xlsx)
-            print(f"✓ Excel written to: {out_xlsx}  (openpyxl not found; formatting not preserved)")
-
-    elif ext.lower() == ".csv":
-        # ── CSV input path ────────────────────────────────────────────────
-        df = pd.read_csv(input_path, dtype=str, keep_default_na=False)
-        df_converted = _apply_to_df(df)
-        write_csv(df_converted, out_csv)
-        print(f"✓ CSV written to:   {out_csv}")
+    # One pool for the whole run; workers start only if a batch needs them
+    with ConversionPool(args.jobs) as pool:
+        if ext.lower() in (".xlsx", ".xls"):
+            # ── Excel input path ──────────────────────────────────────────
+            if load_workbook is not None and ext.lower() == ".xlsx":
+                # Parse once: the same workbook feeds the CSV (before conversion,
+                # so headers are de-duplicated exactly as pandas would) and the
+                # formatting-preserved Excel copy.
+                wb = load_workbook(input_path, data_only=False)
+                try:
+                    write_csv_from_workbook(wb, out_csv, pool)
+                except _FormulaCellError:
+                    # Formula results are only cached in data_only mode
+                    write_csv_from_xlsx(input_path, out_csv, pool)
+                print(f"✓ CSV written to:   {out_csv}")
+
+                convert_workbook_inplace(wb, pool)
+                os.makedirs(out_dir, exist_ok=True)
+                wb.save(out_xlsx)
+                print(f"✓ Excel written to: {out_xlsx}")
+                return
+
+            # 1. Write CSV (via pandas — .xls, or openpyxl missing)
+            df = pd.read_excel(input_path, dtype=_STR_DTYPE, keep_default_na=False)
+            df_converted = _apply_to_df(df, pool)
+            write_csv(df_converted, out_csv)
+            print(f"✓ CSV written to:   {out_csv}")
+
+            # 2. Write formatting-preserved Excel (via openpyxl direct edit)
+            if load_workbook is not None:
+                write_excel_preserve_formatting(input_path, out_xlsx, pool)
+                print(f"✓ Excel written to: {out_xlsx}")
+            else:
+                # Fallback — no formatting preserved but still useful
+                write_excel_from_df(df_converted, out_xlsx)
+                print(f"✓ Excel written to: {out_xlsx}  (openpyxl not found; formatting not preserved)")
+
+        elif ext.lower() == ".csv":
+            # ── CSV input path ────────────────────────────────────────────
+            df = pd.read_csv(input_path, dtype=_STR_DTYPE, keep_default_na=False)
+            df_converted = _apply_to_df(df, pool)
+            write_csv(df_converted, out_csv)
+            print(f"✓ CSV written to:   {out_csv}")
 
-        write_excel_from_df(df_converted, out_xlsx)
-        print(f"✓ Excel written to: {out_xlsx}")
+            write_excel_from_df(df_converted, out_xlsx)
+            print(f"✓ Excel written to: {out_xlsx}")
 
-    else:
-        raise ValueError(f"Unsupported file type: {ext}. Use .xlsx, .xls, or .csv")
+        else:
+            raise ValueError(f"Unsupported file type: {ext}. Use .xlsx, .xls, or .csv")
 
 
 if __name__ == "__main__":
@@ -4,6 +4,9 @@ from . import views
 
 app_name = "reporter"
 
+# Literal routes only, ordered by expected hit frequency — the resolver
+# scans this list top to bottom. The preset-columns API stays last: the
+# configure page embeds every preset's columns, so the UI never calls it.
 urlpatterns = [
     path("", views.upload_view, name="upload"),
     path("configure/", views.configure_view, name="configure"),
@@ -9,11 +9,19 @@ Handles:
 - Export DOCX generation (per-employee, zipped when multiple)
 """
 
+import contextlib
+import functools
 import io
 import os
+import re
+import tempfile
 import zipfile
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from xml.sax.saxutils import escape
 
+import numpy as np
 import pandas as pd
 import unicodeconverter as uc
 from docx import Document
@@ -22,7 +30,16 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from docx.shared import Cm, Pt, RGBColor
-from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+# The Rust-based calamine reader parses workbooks many times faster than
+# openpyxl; without it pandas falls back to openpyxl (already read_only).
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = None
 
 # ── Bengali Unicode ranges ─────────────────────────────────────────────────
 _BN_START = 0x0980
@@ -33,6 +50,23 @@ _VOWEL_SIGN_HI = 0x09CC
 # Khanda Ta: maps to 'r' in Bijoy – invalid mid-word in real Bengali
 _KHANDA_TA = "\u09CE"
 
+# Range scans run in the regex engine (C) instead of a per-codepoint loop;
+# faster than a NumPy UTF-32 view too, whose setup dominates on short cells
+_BN_CLASS = f"[{chr(_BN_START)}-{chr(_BN_END)}]"
+_RE_BENGALI = re.compile(_BN_CLASS)
+_RE_VOWEL_SIGN = re.compile(f"[{chr(_VOWEL_SIGN_LO)}-{chr(_VOWEL_SIGN_HI)}]")
+_RE_BAD_KHANDA_TA = re.compile(_KHANDA_TA + _BN_CLASS)
+# Word characters minus digits/underscore: every str.isalpha() character
+# matches (plus a few numeric symbols), so it is a safe pre-filter
+_RE_LETTER = re.compile(r"[^\W\d_]")
+
+# Fewest documents worth one worker process: ~60 ms of in-process building,
+# several times what forking a worker and shipping its results back costs.
+# An export therefore needs twice this before a pool is started at all.
+_DOCS_PER_WORKER = 16
+# DOCX archives larger than this are spooled to a temporary file
+_ZIP_SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
 # ── Fallback column positions used only when auto-detection fails ─────────
 _FALLBACK_ID_IDX   = 3   # পার্সোনেল নং  in the standard AGM sheet
 _FALLBACK_NAME_IDX = 5   # নাম            in the standard AGM sheet
@@ -44,6 +78,11 @@ _NAME_KEYWORDS = ["নাম", "name"]
 _NAME_EXACT    = ["নাম", "name_bn", "name"]
 
 
+# Substring keyword groups as single alternations (matched against lowercased names)
+_RE_ID_KEYWORDS   = re.compile("|".join(map(re.escape, _ID_KEYWORDS)))
+_RE_NAME_KEYWORDS = re.compile("|".join(map(re.escape, _NAME_KEYWORDS)))
+
+
 def _detect_id_name_cols(columns: List[str]) -> Tuple[int, int]:
     """Return (id_col_index, name_col_index) by scanning column headers.
 
@@ -52,40 +91,31 @@ def _detect_id_name_cols(columns: List[str]) -> Tuple[int, int]:
     2. Substring match on keyword lists
     3. Fallback to _FALLBACK_*_IDX (clamped to actual column count)
     """
-    lower = [c.lower().strip() for c in columns]
-
-    id_idx: Optional[int] = None
-    name_idx: Optional[int] = None
-
-    # ── ID column ──────────────────────────────────────────────────────
-    # Exact match first
-    for exact in _ID_EXACT:
-        if exact in lower:
-            id_idx = lower.index(exact)
-            break
-    # Substring match
-    if id_idx is None:
-        for i, c in enumerate(lower):
-            if any(kw in c for kw in _ID_KEYWORDS):
-                id_idx = i
-                break
-    # Positional fallback
+    return _detect_id_name_cols_cached(tuple(columns))
+
+
+@functools.lru_cache(maxsize=64)
+def _detect_id_name_cols_cached(columns: Tuple[str, ...]) -> Tuple[int, int]:
+    """_detect_id_name_cols on a hashable tuple; headers repeat across requests."""
+    # One pass: first index of each normalised name, first keyword hit per group
+    first_idx: Dict[str, int] = {}
+    id_sub: Optional[int] = None
+    name_sub: Optional[int] = None
+    for i, col in enumerate(columns):
+        c = col.lower().strip()
+        first_idx.setdefault(c, i)
+        if id_sub is None and _RE_ID_KEYWORDS.search(c):
+            id_sub = i
+        if name_sub is None and _RE_NAME_KEYWORDS.search(c):
+            name_sub = i
+
+    # ── ID column: exact match, then substring, then positional fallback ──
+    id_idx = next((first_idx[e] for e in _ID_EXACT if e in first_idx), id_sub)
     if id_idx is None:
         id_idx = min(_FALLBACK_ID_IDX, len(columns) - 1)
 
     # ── Name column ────────────────────────────────────────────────────
-    # Exact match first
-    for exact in _NAME_EXACT:
-        if exact in lower:
-            name_idx = lower.index(exact)
-            break
-    # Substring match
-    if name_idx is None:
-        for i, c in enumerate(lower):
-            if any(kw in c for kw in _NAME_KEYWORDS):
-                name_idx = i
-                break
-    # Positional fallback
+    name_idx = next((first_idx[e] for e in _NAME_EXACT if e in first_idx), name_sub)
     if name_idx is None:
         name_idx = min(_FALLBACK_NAME_IDX, len(columns) - 1)
 
@@ -139,20 +169,19 @@ REPORT_PRESETS: Dict[str, Dict] = {
 # ── Bijoy → Unicode helpers ────────────────────────────────────────────────
 
 def _has_bengali(text: str) -> bool:
-    return any(_BN_START <= ord(c) <= _BN_END for c in text)
+    return _RE_BENGALI.search(text) is not None
 
 
 def _has_vowel_sign(text: str) -> bool:
-    return any(_VOWEL_SIGN_LO <= ord(c) <= _VOWEL_SIGN_HI for c in text)
+    return _RE_VOWEL_SIGN.search(text) is not None
 
 
 def _has_invalid_khanda_ta(text: str) -> bool:
     """Khanda Ta mid-word is a strong indicator of garbled English→Bijoy output."""
-    for i, ch in enumerate(text):
-        if ch == _KHANDA_TA and i + 1 < len(text):
-            if _BN_START <= ord(text[i + 1]) <= _BN_END:
-                return True
-    return False
+    # Khanda Ta is rare: a plain substring test settles most strings
+    if _KHANDA_TA not in text:
+        return False
+    return _RE_BAD_KHANDA_TA.search(text) is not None
 
 
 def convert_bijoy_value(value: Any) -> Any:
@@ -189,7 +218,69 @@ def convert_bijoy_value(value: Any) -> Any:
     return value
 
 
+# Memos shared across uploads: HR sheets repeat the same designations, branch
+# and department names, so each distinct string is converted only once.
+# Cleared wholesale when full to keep memory bounded.
+_BIJOY_CACHE_MAX = 100_000
+_BIJOY_CACHE: Dict[str, Any] = {}
+_COL_NAME_CACHE: Dict[str, str] = {}
+
+
+def _cached_convert_bijoy_value(text: str) -> Any:
+    """convert_bijoy_value memoised in _BIJOY_CACHE."""
+    try:
+        return _BIJOY_CACHE[text]
+    except KeyError:
+        pass
+    if len(_BIJOY_CACHE) >= _BIJOY_CACHE_MAX:
+        _BIJOY_CACHE.clear()
+    converted = _BIJOY_CACHE[text] = convert_bijoy_value(text)
+    return converted
+
+
+def _convert_bijoy_series(s: pd.Series) -> pd.Series:
+    """Convert the strings of an object column via a per-unique-value mapping.
+
+    Returns ``s`` itself when nothing in the column needs converting.
+    """
+    uniq = pd.Series(s.unique(), dtype=object)
+    try:
+        text = uniq.str
+    except AttributeError:  # no strings at all (numbers, dates, blanks)
+        return s
+    # Only text with a letter and no Bengali codepoint can be Bijoy; numbers,
+    # codes and already-Unicode cells are filtered out here in C, so columns
+    # of an all-Unicode or all-numeric sheet never reach the converter
+    needs_convert = (
+        text.contains(_RE_LETTER.pattern, na=False)
+        & ~text.contains(_RE_BENGALI.pattern, na=False)
+    )
+    if not needs_convert.any():
+        return s
+    mapping: Dict[str, Any] = {}
+    for v in uniq[needs_convert]:
+        converted = _cached_convert_bijoy_value(v)
+        if converted is not v:
+            mapping[v] = converted
+    if not mapping:
+        return s
+    mapped = s.map(mapping)
+    return s.where(mapped.isna(), mapped)
+
+
 def _convert_col_name(raw: str) -> str:
+    """Memoised _convert_col_name_uncached (see _COL_NAME_CACHE)."""
+    try:
+        return _COL_NAME_CACHE[raw]
+    except KeyError:
+        pass
+    if len(_COL_NAME_CACHE) >= _BIJOY_CACHE_MAX:
+        _COL_NAME_CACHE.clear()
+    name = _COL_NAME_CACHE[raw] = _convert_col_name_uncached(raw)
+    return name
+
+
+def _convert_col_name_uncached(raw: str) -> str:
     """Convert a single column name from Bijoy to Unicode, cleaning up whitespace.
 
     Uses the same strict check as convert_bijoy_value (vowel signs required) so
@@ -228,7 +319,7 @@ def load_and_process_excel(file_path: str) -> Tuple[pd.DataFrame, List[str]]:
         df           – processed DataFrame (unicode column names + values)
         columns      – list of unicode column names (same as df.columns)
     """
-    df = pd.read_excel(file_path)
+    df = pd.read_excel(file_path, engine=_EXCEL_ENGINE)
 
     # Convert column names
     unicode_cols: List[str] = []
@@ -245,20 +336,81 @@ def load_and_process_excel(file_path: str) -> Tuple[pd.DataFrame, List[str]]:
 
     df.columns = unicode_cols
 
-    # Convert cell values
-    df = df.map(lambda v: convert_bijoy_value(v) if isinstance(v, str) else v)
+    # Convert cell values (only object columns can hold strings)
+    for col in df.columns:
+        values = df[col]
+        if values.dtype == object:
+            converted = _convert_bijoy_series(values)
+            if converted is not values:
+                df[col] = converted
 
     # Normalise date columns → readable strings so they don't cause serialisation issues
-    for col in df.columns:
-        if pd.api.types.is_datetime64_any_dtype(df[col]):
-            df[col] = df[col].dt.strftime("%d/%m/%Y")
+    for col in df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+        df[col] = df[col].dt.strftime("%d/%m/%Y")
 
     # Replace NaN with empty string for display
-    df = df.where(pd.notna(df), "")
+    df = df.fillna("")
 
     return df, unicode_cols
 
 
+# Suffix of the pickled, already-processed DataFrame stored beside an upload
+_PROCESSED_SUFFIX = ".processed.pkl"
+
+
+def load_processed_excel(file_path: str) -> Tuple[pd.DataFrame, List[str]]:
+    """Cached load_and_process_excel: parse and convert an upload only once.
+
+    The processed DataFrame is pickled beside the upload and reused by every
+    later request while it is at least as new as the source file. A missing,
+    stale or unreadable sidecar falls back to a full reload, which rewrites it.
+    """
+    cache_path = file_path + _PROCESSED_SUFFIX
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+        try:
+            df = pd.read_pickle(cache_path)
+            return df, list(df.columns)
+        except Exception:
+            pass  # partial/corrupt sidecar → rebuild below
+
+    df, columns = load_and_process_excel(file_path)
+
+    # Write to a unique temp file first so concurrent requests (threads or
+    # processes) never read half a file or clobber each other's writes
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(cache_path), prefix=os.path.basename(cache_path), suffix=".tmp"
+        )
+        with os.fdopen(fd, "wb") as f:
+            df.to_pickle(f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # caching is best-effort; just don't leave the temp file behind
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+    return df, columns
+
+
+def discard_upload(file_path: str) -> None:
+    """Delete an upload and its processed sidecar, if present."""
+    for path in (file_path, file_path + _PROCESSED_SUFFIX):
+        with contextlib.suppress(OSError):
+            os.remove(path)
+
+
+# What int() accepts once the string is stripped (any Unicode digits)
+_RE_INT = r"[+-]?\d+(?:_\d+)*"
+
+
+def _small_int_mask(values: pd.Series) -> np.ndarray:
+    """Boolean array: True where int(value) is 1..60 (column-numbering rows)."""
+    mask = values.str.fullmatch(_RE_INT).to_numpy(dtype=bool)
+    mask[mask] = [0 < int(v) <= 60 for v in values.to_numpy()[mask]]
+    return mask
+
+
 def get_employee_list(df: pd.DataFrame) -> List[Dict[str, str]]:
     """Return a list of {id, name} dicts for the employee multi-select."""
     cols = list(df.columns)
@@ -269,23 +421,17 @@ def get_employee_list(df: pd.DataFrame) -> List[Dict[str, str]]:
     id_col   = cols[id_idx]
     name_col = cols[name_idx]
 
-    employees = []
-    for _, row in df.iterrows():
-        emp_id = str(row[id_col]).strip()
-        name   = str(row[name_col]).strip()
-        if not emp_id or emp_id in ("", "nan"):
-            continue
-        # Skip placeholder header rows where both ID and name are small integers
-        try:
-            id_int   = int(emp_id)
-            name_int = int(name)
-            if 0 < id_int <= 60 and 0 < name_int <= 60:
-                continue   # looks like a column-numbering header row
-        except (ValueError, TypeError):
-            pass
-        employees.append({"id": emp_id, "name": name or emp_id})
+    ids   = df[id_col].astype(str).str.strip()
+    names = df[name_col].astype(str).str.strip()
+
+    keep = ((ids != "") & (ids != "nan")).to_numpy()
+    # Skip placeholder header rows where both ID and name are small integers
+    keep &= ~(_small_int_mask(ids) & _small_int_mask(names))
 
-    return employees
+    return [
+        {"id": emp_id, "name": name or emp_id}
+        for emp_id, name in zip(ids.to_numpy()[keep], names.to_numpy()[keep])
+    ]
 
 
 def get_preset_columns(preset_key: str, columns: List[str]) -> List[str]:
@@ -298,6 +444,78 @@ def get_preset_columns(preset_key: str, columns: List[str]) -> List[str]:
 
 # ── Export ─────────────────────────────────────────────────────────────────
 
+class _SafeFilenameTable(dict):
+    """str.translate table keeping alphanumerics and ' _-', mapping the rest to '_'.
+
+    Entries are filled in on first lookup rather than precomputed for all
+    0x110000 code points; isalnum() keeps Bengali letters and digits.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        ch = chr(codepoint)
+        mapped = self[codepoint] = ch if ch.isalnum() or ch in " _-" else "_"
+        return mapped
+
+
+_SAFE_FILENAME_TABLE = _SafeFilenameTable()
+
+
+def safe_filename(text: str) -> str:
+    """Replace every character unsafe in a download filename with '_'."""
+    return text.translate(_SAFE_FILENAME_TABLE)
+
+
+# An ID int() can parse and str() gives back (ASCII digits, optional minus)
+_RE_INT_KEY = re.compile(r"-?[0-9]+")
+
+
+def _employee_mask(ids: pd.Series, employee_ids: List[str]) -> pd.Series:
+    """Rows whose ID, as text, is one of employee_ids.
+
+    Integer ID columns (the usual case) are matched natively against the
+    canonical integer keys, so the column is never converted to strings.
+    """
+    wanted = frozenset(str(e).strip() for e in employee_ids)
+    if pd.api.types.is_integer_dtype(ids):
+        int_keys = frozenset(
+            int(w) for w in wanted
+            if _RE_INT_KEY.fullmatch(w) and str(int(w)) == w
+        )
+        return ids.isin(int_keys)
+    return ids.astype(str).isin(wanted)
+
+
+def _add_header_style(wb) -> str:
+    """Register the export header named style on wb and return its name."""
+    thin = Side(style="thin")
+    wb.add_named_style(NamedStyle(
+        name="report_header",
+        font=Font(bold=True, size=11, color="FFFFFF", name="Nirmala UI"),
+        fill=PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid"),
+        alignment=Alignment(horizontal="center", vertical="center", wrap_text=True),
+        # pandas draws a thin border round header cells; keep it
+        border=Border(left=thin, right=thin, top=thin, bottom=thin),
+    ))
+    return "report_header"
+
+
+def _add_body_style(wb, number_format: str, styles: Dict[str, str]) -> str:
+    """Return the body named style for number_format, registering it on first use.
+
+    One style per number format so dates written by pandas keep their format.
+    """
+    name = styles.get(number_format)
+    if name is None:
+        name = styles[number_format] = f"report_body_{len(styles)}"
+        wb.add_named_style(NamedStyle(
+            name=name,
+            font=Font(name="Nirmala UI", size=10),
+            alignment=Alignment(vertical="center", wrap_text=False),
+            number_format=number_format,
+        ))
+    return name
+
+
 def generate_export_excel(
     df: pd.DataFrame,
     selected_columns: List[str],
@@ -319,18 +537,25 @@ def generate_export_excel(
     id_idx, _ = _detect_id_name_cols(list(df.columns))
     id_col = list(df.columns)[id_idx]
 
-    # ── Filter rows ──────────────────────────────────────────────────────
+    # ── Filter columns ───────────────────────────────────────────────────
+    valid_cols = [c for c in selected_columns if c in df.columns]
+    if not valid_cols:
+        valid_cols = list(df.columns)
+
+    # ── Filter rows (one selection; nothing below writes to df_out) ──────
     if employee_ids:
-        mask = df[id_col].astype(str).isin([str(e).strip() for e in employee_ids])
-        df_out = df[mask].copy()
+        df_out = df.loc[_employee_mask(df[id_col], employee_ids), valid_cols]
     else:
-        df_out = df.copy()
+        df_out = df[valid_cols]
 
-    # ── Filter columns ───────────────────────────────────────────────────
-    valid_cols = [c for c in selected_columns if c in df_out.columns]
-    if not valid_cols:
-        valid_cols = list(df_out.columns)
-    df_out = df_out[valid_cols]
+    # ── Column widths (header and every value, measured on the frame) ────
+    # Only distinct non-blank values are stringified: HR columns repeat a
+    # handful of designations/branches, so this is far fewer than N cells
+    widths = []
+    for pos, col in enumerate(df_out.columns):
+        values = df_out.iloc[:, pos].dropna().drop_duplicates()
+        longest = int(values.astype(str).str.len().max()) if len(values) else 0
+        widths.append(max(min(max(len(str(col)), longest) + 4, 42), 12))
 
     # ── Write to BytesIO ─────────────────────────────────────────────────
     output = io.BytesIO()
@@ -340,39 +565,21 @@ def generate_export_excel(
         df_out.to_excel(writer, sheet_name=sheet_name, index=False)
         ws = writer.sheets[sheet_name]
 
-        # ── Header styling ────────────────────────────────────────────
-        hdr_fill = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
-        hdr_font = Font(bold=True, size=11, color="FFFFFF", name="Nirmala UI")
-        hdr_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
+        # Styles are registered once and referenced by name, so each cell
+        # stores a style index instead of its own Font/Fill/Alignment copies
+        hdr_style = _add_header_style(writer.book)
         for cell in ws[1]:
-            cell.font = hdr_font
-            cell.fill = hdr_fill
-            cell.alignment = hdr_align
+            cell.style = hdr_style
 
         ws.row_dimensions[1].height = 28
 
-        # ── Body cell font for Bengali ────────────────────────────────
-        body_font = Font(name="Nirmala UI", size=10)
-        body_align = Alignment(vertical="center", wrap_text=False)
-
+        body_styles: Dict[str, str] = {}
         for row in ws.iter_rows(min_row=2):
             for cell in row:
-                cell.font = body_font
-                cell.alignment = body_align
-
-        # ── Auto-size columns ────────────────────────────────────────
-        for col_cells in ws.columns:
-            max_len = 0
-            col_letter = col_cells[0].column_letter
-            for cell in col_cells:
-                try:
-                    cell_len = len(str(cell.value)) if cell.value is not None else 0
-                    if cell_len > max_len:
-                        max_len = cell_len
-                except Exception:
-                    pass
-            ws.column_dimensions[col_letter].width = max(min(max_len + 4, 42), 12)
+                cell.style = _add_body_style(writer.book, cell.number_format, body_styles)
+
+        for idx, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(idx)].width = width
 
         # ── Freeze header row ────────────────────────────────────────
         ws.freeze_panes = "A2"
@@ -421,16 +628,16 @@ def _fix_table_col_widths(table, col_twips: tuple) -> None:
         tblPr = OxmlElement("w:tblPr")
         tbl.insert(0, tblPr)
 
-    # Fixed layout
-    tblLayout = OxmlElement("w:tblLayout")
-    tblLayout.set(qn("w:type"), "fixed")
-    tblPr.append(tblLayout)
+    # Fixed layout / total table width: update in place if already present
+    # so repeated calls never add duplicate children
+    tblPr.get_or_add_tblLayout().set(qn("w:type"), "fixed")
 
-    # Total table width
-    tblW = OxmlElement("w:tblW")
+    tblW = tblPr.find(qn("w:tblW"))
+    if tblW is None:
+        tblW = OxmlElement("w:tblW")
+        tblPr.append(tblW)
     tblW.set(qn("w:w"), str(sum(col_twips)))
     tblW.set(qn("w:type"), "dxa")
-    tblPr.append(tblW)
 
     # Patch existing gridCol elements
     tblGrid = tbl.find(qn("w:tblGrid"))
@@ -439,27 +646,45 @@ def _fix_table_col_widths(table, col_twips: tuple) -> None:
             if i < len(col_twips):
                 gc.set(qn("w:w"), str(col_twips[i]))
 
-    # Stamp tcW on every cell
-    for tbl_row in table.rows:
-        for i, cell in enumerate(tbl_row.cells):
-            if i < len(col_twips):
-                tc   = cell._tc
-                tcPr = tc.get_or_add_tcPr()
-                # Remove any existing tcW to avoid duplicates
-                for old in tcPr.findall(qn("w:tcW")):
-                    tcPr.remove(old)
-                tcW = OxmlElement("w:tcW")
-                tcW.set(qn("w:w"), str(col_twips[i]))
-                tcW.set(qn("w:type"), "dxa")
-                tcPr.append(tcW)
+    # Stamp tcW on every cell, straight off the w:tr/w:tc elements (no
+    # _Row/_Cell proxies) and updating an existing tcW in place
+    widths = [str(w) for w in col_twips]
+    for tr in tbl.tr_lst:
+        for tc, width in zip(tr.tc_lst, widths):
+            tcW = tc.get_or_add_tcPr().get_or_add_tcW()
+            tcW.set(qn("w:w"), width)
+            tcW.set(qn("w:type"), "dxa")
 
 
-def _make_employee_docx(
-    row: "pd.Series",
-    selected_columns: List[str],
-    report_title: str,
-) -> bytes:
-    """Build a Word document for a single employee.
+# Placeholder texts marking where labels/values go in the rendered template
+_LABEL_TOKEN = "@@LABEL@@"
+_VALUE_TOKEN = "@@VALUE@@"
+_LABEL_SLOT = f"<w:t>{_LABEL_TOKEN}</w:t>"
+_VALUE_SLOT = f"<w:t>{_VALUE_TOKEN}</w:t>"
+_RE_TABLE_ROW = re.compile(r"<w:tr>.*?</w:tr>", re.S)
+_RE_RUN_BREAK = re.compile(r"([\t\r\n])")
+# Characters XML 1.0 cannot contain (python-docx/lxml reject them outright)
+_RE_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+class _DocxTemplate(NamedTuple):
+    """Pre-rendered pieces of the per-employee document (see _build_docx_template)."""
+
+    parts: Tuple[Tuple[str, Optional[bytes]], ...]   # package parts; None = document.xml
+    head:  str                                       # document.xml up to the first row
+    rows:  Tuple[Tuple[str, str, str], ...]          # even/odd row split at label, value
+    tail:  str                                       # document.xml after the last row
+
+
+@functools.lru_cache(maxsize=8)
+def _build_docx_template(report_title: str) -> _DocxTemplate:
+    """Render the employee document once with python-docx and cut it into pieces.
+
+    Every employee's document is identical apart from the table rows, so the
+    page setup, styles, header, title and static package parts are built
+    here once; _make_employee_docx only fills in the rows. Cached per title,
+    so repeat exports (and each pool worker after its first document) skip
+    python-docx entirely.
 
     Layout:
     - Centred bold title (report_title)
@@ -504,34 +729,22 @@ def _make_employee_docx(
 
     doc.add_paragraph()  # spacer
 
-    # ── Build rows ────────────────────────────────────────────────────────
-    valid_cols = [
-        c for c in selected_columns
-        if c in row.index and str(row[c]).strip() not in ("", "nan", "NaN")
-    ]
-    if not valid_cols:
-        valid_cols = [c for c in selected_columns if c in row.index]
-
-    # ── Table ─────────────────────────────────────────────────────────────
-    table = doc.add_table(rows=len(valid_cols), cols=3)
+    # ── Table: two placeholder rows, one per shading ─────────────────────
+    table = doc.add_table(rows=2, cols=3)
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
 
     # label: 6.5 cm | colon: 0.5 cm | value: 9.0 cm  (twips: 1 cm ≈ 567)
     _COL_TWIPS = (3685, 484, 5102)
 
-    for row_idx, col_name in enumerate(valid_cols):
-        cells = table.rows[row_idx].cells
-
-        val = str(row[col_name]).strip()
-        if val in ("nan", "NaN"):
-            val = ""
+    for row_idx, tbl_row in enumerate(table.rows):
+        cells = tbl_row.cells
 
         # Cell 0 – field label
-        cells[0].text = col_name
+        cells[0].text = _LABEL_TOKEN
         # Cell 1 – separator
         cells[1].text = "ঃ"
         # Cell 2 – value
-        cells[2].text = val
+        cells[2].text = _VALUE_TOKEN
 
         # Row shading: alternate between white and very light blue
         shade = "EEF4FB" if row_idx % 2 == 0 else "FFFFFF"
@@ -561,8 +774,105 @@ def _make_employee_docx(
 
     output = io.BytesIO()
     doc.save(output)
-    output.seek(0)
-    return output.read()
+
+    # ── Cut the package apart ─────────────────────────────────────────────
+    with zipfile.ZipFile(output) as zf:
+        parts = tuple(
+            (info.filename, None if info.filename == "word/document.xml" else zf.read(info))
+            for info in zf.infolist()
+        )
+        document = zf.read("word/document.xml").decode("utf-8")
+
+    first, second = _RE_TABLE_ROW.finditer(document)
+    rows = []
+    for match in (first, second):
+        pre, rest = match.group().split(_LABEL_SLOT)
+        mid, post = rest.split(_VALUE_SLOT)
+        rows.append((pre, mid, post))
+    return _DocxTemplate(
+        parts=parts,
+        head=document[:first.start()],
+        rows=tuple(rows),
+        tail=document[second.end():],
+    )
+
+
+def _run_text_xml(text: str) -> str:
+    """Run content for text, as python-docx writes it: <w:t>, <w:tab/>, <w:br/>."""
+    out = []
+    for piece in _RE_RUN_BREAK.split(_RE_XML_INVALID.sub("", text)):
+        if piece == "\t":
+            out.append("<w:tab/>")
+        elif piece in ("\r", "\n"):
+            out.append("<w:br/>")
+        elif piece:
+            space = ' xml:space="preserve"' if piece.strip() != piece else ""
+            out.append(f"<w:t{space}>{escape(piece)}</w:t>")
+    return "".join(out)
+
+
+def _make_employee_docx(
+    col_labels: List[str],
+    values: List[str],
+    report_title: str,
+) -> bytes:
+    """Build a Word document for a single employee from the cached template.
+
+    ``values`` holds the employee's already-stringified cells, aligned with
+    ``col_labels``.
+    """
+    template = _build_docx_template(report_title)
+
+    # ── Build rows ────────────────────────────────────────────────────────
+    fields = [(label, val.strip()) for label, val in zip(col_labels, values)]
+    rows = [(label, val) for label, val in fields if val not in ("", "nan", "NaN")]
+    if not rows:
+        rows = fields
+
+    body = []
+    for row_idx, (col_name, val) in enumerate(rows):
+        if val in ("nan", "NaN"):
+            val = ""
+        pre, mid, post = template.rows[row_idx % 2]
+        body.append(pre + _run_text_xml(col_name) + mid + _run_text_xml(val) + post)
+    document = (template.head + "".join(body) + template.tail).encode("utf-8")
+
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for name, data in template.parts:
+            zf.writestr(name, document if data is None else data)
+    return output.getvalue()
+
+
+def _iter_employee_docx(
+    col_labels: List[str],
+    values: List[List[str]],
+    report_title: str,
+) -> Iterator[bytes]:
+    """Yield one DOCX per row of values, in order.
+
+    Documents are independent and CPU-bound, so larger exports are built
+    across worker processes, each given at least _DOCS_PER_WORKER of them;
+    smaller ones stay in-process, where starting a pool costs more than it
+    saves.
+    """
+    jobs = min(os.cpu_count() or 1, len(values) // _DOCS_PER_WORKER)
+    if jobs < 2:
+        for emp_values in values:
+            yield _make_employee_docx(col_labels, emp_values, report_title)
+        return
+
+    # Render the template before forking so every worker inherits the cache
+    _build_docx_template(report_title)
+    chunksize = max(1, len(values) // (4 * jobs))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(
+            _make_employee_docx,
+            repeat(col_labels),
+            values,
+            repeat(report_title),
+            chunksize=chunksize,
+        )
 
 
 def generate_export_docx_zip(
@@ -570,7 +880,7 @@ def generate_export_docx_zip(
     selected_columns: List[str],
     employee_ids: Optional[List[str]] = None,
     report_title: str = "Employee Report",
-) -> Tuple[bytes, bool]:
+) -> Tuple[IO[bytes], bool]:
     """Generate one DOCX per employee and optionally wrap them in a ZIP.
 
     Args:
@@ -580,20 +890,20 @@ def generate_export_docx_zip(
         report_title     – title printed at the top of every document
 
     Returns:
-        (file_bytes, is_zip)
-        is_zip=False → file_bytes is a single .docx
-        is_zip=True  → file_bytes is a .zip of multiple .docx files
+        (file_obj, is_zip) – file_obj is a binary file positioned at the start
+        is_zip=False → file_obj holds a single .docx
+        is_zip=True  → file_obj holds a .zip of multiple .docx files
+                       (spooled to disk past _ZIP_SPOOL_MAX_BYTES)
     """
     id_idx, name_idx = _detect_id_name_cols(list(df.columns))
     id_col   = list(df.columns)[id_idx]
     name_col = list(df.columns)[name_idx]
 
-    # ── Filter rows ──────────────────────────────────────────────────────
+    # ── Filter rows (read-only below, so no defensive copy) ──────────────
     if employee_ids:
-        mask   = df[id_col].astype(str).isin([str(e).strip() for e in employee_ids])
-        df_out = df[mask].copy()
+        df_out = df[_employee_mask(df[id_col], employee_ids)]
     else:
-        df_out = df.copy()
+        df_out = df
 
     # ── Filter columns ───────────────────────────────────────────────────
     valid_cols = [c for c in selected_columns if c in df_out.columns]
@@ -601,37 +911,38 @@ def generate_export_docx_zip(
         valid_cols = list(df_out.columns)
 
     # ── Generate per-employee DOCX ───────────────────────────────────────
-    docx_files: List[Tuple[str, bytes]] = []
-    for _, row in df_out.iterrows():
-        emp_id   = str(row[id_col]).strip()
-        emp_name = str(row.get(name_col, emp_id)).strip()
+    ids    = df_out[id_col].astype(str).str.strip().to_numpy()
+    names  = df_out[name_col].astype(str).str.strip().to_numpy()
+    values = df_out[valid_cols].astype(str).to_numpy().tolist()
+
+    filenames: List[str] = []
+    for emp_id, emp_name in zip(ids, names):
         if emp_name in ("nan", "NaN", ""):
             emp_name = emp_id
 
-        docx_bytes = _make_employee_docx(row, valid_cols, report_title)
-
-        safe_name = "".join(
-            c if c.isalnum() or c in " _-" else "_" for c in emp_name
-        ).strip("_")
-        filename = f"{safe_name}_{emp_id}.docx"
-        docx_files.append((filename, docx_bytes))
+        safe_name = safe_filename(emp_name).strip("_")
+        filenames.append(f"{safe_name}_{emp_id}.docx")
 
-    if not docx_files:
+    if not filenames:
         # Fallback: empty doc
         doc = Document()
         doc.add_paragraph("No data found.")
         buf = io.BytesIO()
         doc.save(buf)
         buf.seek(0)
-        return buf.read(), False
+        return buf, False
 
-    if len(docx_files) == 1:
-        return docx_files[0][1], False
+    docs = _iter_employee_docx(valid_cols, values, report_title)
+    if len(filenames) == 1:
+        return io.BytesIO(next(docs)), False
 
     # ── Multiple employees → ZIP ─────────────────────────────────────────
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        for filename, docx_bytes in docx_files:
+    # Each document goes into the archive as soon as it is built, so only
+    # one DOCX is held in memory; large archives spill over to disk.
+    # DOCX parts are already deflated, so a low compresslevel loses little.
+    zip_file = tempfile.SpooledTemporaryFile(max_size=_ZIP_SPOOL_MAX_BYTES)
+    with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED, compresslevel=3) as zf:
+        for filename, docx_bytes in zip(filenames, docs):
             zf.writestr(filename, docx_bytes)
-    zip_buffer.seek(0)
-    return zip_buffer.read(), True
+    zip_file.seek(0)
+    return zip_file, True
@@ -3,17 +3,19 @@ import uuid
 
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
-from django.http import HttpResponse, JsonResponse
+from django.http import FileResponse, HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
 from django.views.decorators.http import require_GET, require_POST
 
 from .utils import (
     REPORT_PRESETS,
+    discard_upload,
     generate_export_docx_zip,
     generate_export_excel,
     get_employee_list,
     get_preset_columns,
-    load_and_process_excel,
+    load_processed_excel,
+    safe_filename,
 )
 
 # ── Upload ─────────────────────────────────────────────────────────────────
@@ -41,9 +43,19 @@ def upload_view(request):
                 for chunk in uploaded_file.chunks():
                     fh.write(chunk)
 
-            request.session["excel_path"] = file_path
-            request.session["original_filename"] = uploaded_file.name
-            return redirect("reporter:configure")
+            # Parse + convert once here; later views reuse the cached result
+            try:
+                _, columns = load_processed_excel(file_path)
+            except Exception as exc:
+                # Not stored in the session, so nothing would ever read it
+                discard_upload(file_path)
+                error = f"ফাইল প্রক্রিয়া করতে ব্যর্থ: {exc}"
+            else:
+                request.session["excel_path"] = file_path
+                request.session["original_filename"] = uploaded_file.name
+                # Header list for the preset AJAX endpoint (no DataFrame load)
+                request.session["columns"] = columns
+                return redirect("reporter:configure")
 
     return render(request, "reporter/upload.html", {"error": error})
 
@@ -57,7 +69,7 @@ def configure_view(request):
         return redirect("reporter:upload")
 
     try:
-        df, columns = load_and_process_excel(excel_path)
+        df, columns = load_processed_excel(excel_path)
     except Exception as exc:
         return render(
             request,
@@ -95,7 +107,7 @@ def export_view(request):
         return redirect("reporter:upload")
 
     try:
-        df, columns = load_and_process_excel(excel_path)
+        df, columns = load_processed_excel(excel_path)
     except Exception:
         return redirect("reporter:upload")
 
@@ -113,7 +125,7 @@ def export_view(request):
         report_title,
     )
 
-    safe_name = "".join(c if c.isalnum() or c in " _-" else "_" for c in report_title)
+    safe_name = safe_filename(report_title)
     filename = f"{safe_name}.xlsx"
     response = HttpResponse(
         excel_bytes,
@@ -137,7 +149,7 @@ def export_docx_view(request):
         return redirect("reporter:upload")
 
     try:
-        df, columns = load_and_process_excel(excel_path)
+        df, columns = load_processed_excel(excel_path)
     except Exception:
         return redirect("reporter:upload")
 
@@ -148,14 +160,14 @@ def export_docx_view(request):
     if not selected_columns:
         selected_columns = columns
 
-    file_bytes, is_zip = generate_export_docx_zip(
+    file_obj, is_zip = generate_export_docx_zip(
         df,
         selected_columns,
         employee_ids if employee_ids else None,
         report_title,
     )
 
-    safe_name = "".join(c if c.isalnum() or c in " _-" else "_" for c in report_title)
+    safe_name = safe_filename(report_title)
 
     if is_zip:
         filename     = f"{safe_name}.zip"
@@ -167,7 +179,8 @@ def export_docx_view(request):
             ".wordprocessingml.document"
         )
 
-    response = HttpResponse(file_bytes, content_type=content_type)
+    # Streamed in blocks; FileResponse closes (and so deletes) the file after
+    response = FileResponse(file_obj, content_type=content_type)
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
     response["Access-Control-Expose-Headers"] = "Content-Disposition"
     return response
@@ -187,7 +200,9 @@ def preset_columns_view(request):
         return JsonResponse({"error": "No preset key provided"}, status=400)
 
     try:
-        df, columns = load_and_process_excel(excel_path)
+        columns = request.session.get("columns")
+        if columns is None:
+            _, columns = load_processed_excel(excel_path)
         preset_cols = get_preset_columns(preset_key, columns)
         return JsonResponse({"columns": preset_cols})
     except Exception as exc: